@@ -5,19 +5,25 @@ Incluye análisis de rendimiento, Ley de Amdahl y Taxonomía de Flynn.
 
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from core.matrix_operations import MatrixOperations
+from typing import TYPE_CHECKING
+from core.matrix_operations import MatrixOperations, NUMBA_AVAILABLE, CUDA_AVAILABLE
 from core.parallel_processor import ParallelProcessor
 from core.performance_metrics import PerformanceMetrics
+from core.shared_matrix import SharedMatrix
 from utils.helpers import (
     get_system_info,
+    get_system_info_raw,
     format_matrix_size,
     estimate_memory_usage,
     get_recommended_workers
 )
 
+# Plotly y pandas se importan dentro de las funciones que los usan:
+# su importación inicial es costosa y no todas las pestañas los necesitan
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
 # Configuración de la página
 st.set_page_config(
     page_title="Multiplicación de Matrices Paralelas",
@@ -123,17 +129,36 @@ def main():
         st.sidebar.error("Selecciona al menos un número de workers")
         return
 
+    method_options = ["Threading", "Multiprocessing", "ProcessPoolExecutor", "BLAS multihilo"]
+    if NUMBA_AVAILABLE:
+        method_options.append("Numba")
+    if CUDA_AVAILABLE:
+        method_options.append("CUDA (cuBLAS)")
+
     parallel_method = st.sidebar.selectbox(
         "Método de paralelización",
-        options=["Multiprocessing", "Threading", "ProcessPoolExecutor"],
+        options=method_options,
         index=0,
         help="Método de paralelización a utilizar"
     )
 
+    # Compilar en segundo plano el kernel de Numba para el tamaño elegido
+    if parallel_method == "Numba":
+        MatrixOperations.prewarm_numba_kernel(matrix_size)
+
     # Semilla para reproducibilidad
     use_seed = st.sidebar.checkbox("Usar semilla aleatoria fija", value=True)
     seed = 42 if use_seed else None
 
+    # Solo con un kernel int8 nativo (PyTorch) la versión cuantizada es más rápida
+    use_int8 = False
+    if MatrixOperations.int8_matmul_available():
+        use_int8 = st.sidebar.checkbox(
+            "Precisión reducida (int8)",
+            value=False,
+            help="Añade una multiplicación aproximada cuantizada a int8 como vista previa rápida"
+        )
+
     st.sidebar.markdown("---")
 
     # Botón para ejecutar
@@ -151,7 +176,8 @@ def main():
     # Tab 1: Resultados de ejecución
     with tab1:
         if run_button:
-            execute_multiplication(matrix_size, selected_workers, parallel_method, seed)
+            execute_multiplication(matrix_size, selected_workers, parallel_method, seed,
+                                   use_int8)
         else:
             st.info("👈 Configura los parámetros en el panel lateral y presiona 'Ejecutar Multiplicación'")
 
@@ -168,7 +194,8 @@ def main():
         display_information()
 
 
-def execute_multiplication(matrix_size: int, workers_list: list, method: str, seed: int):
+def execute_multiplication(matrix_size: int, workers_list: list, method: str, seed: int,
+                           use_int8: bool = False):
     """
     Ejecuta la multiplicación de matrices y muestra resultados.
 
@@ -177,14 +204,37 @@ def execute_multiplication(matrix_size: int, workers_list: list, method: str, se
         workers_list: Lista de números de workers
         method: Método de paralelización
         seed: Semilla aleatoria
+        use_int8: Si se ejecuta además la versión cuantizada a int8
     """
+    import pandas as pd
+    import plotly.graph_objects as go
+
     st.markdown('<p class="section-header">🔄 Ejecutando Multiplicación de Matrices</p>',
                 unsafe_allow_html=True)
 
+    # Con semilla fija, las matrices y el baseline solo dependen de (tamaño, semilla, dtype):
+    # se reutilizan entre ejecuciones en lugar de regenerarlos y volver a medirlos
+    baseline_key = (matrix_size, seed, "f32")
+    use_cached_baseline = (
+        seed is not None and st.session_state.get('baseline_key') == baseline_key
+    )
+
     # Generar matrices
-    with st.spinner("Generando matrices aleatorias..."):
-        matrix_a = MatrixOperations.generate_random_matrix(matrix_size, matrix_size, seed)
-        matrix_b = MatrixOperations.generate_random_matrix(matrix_size, matrix_size, seed)
+    if use_cached_baseline:
+        matrix_a = st.session_state['matrix_a']
+        matrix_b = st.session_state['matrix_b']
+    else:
+        with st.spinner("Generando matrices aleatorias..."):
+            matrix_a, matrix_b = MatrixOperations.generate_matrix_pair(
+                matrix_size, matrix_size, seed
+            )
+
+    # Reescritura de datos: operandos float32 C-contiguos antes de repartirlos.
+    # Se generan en int8 y se convierten una sola vez aquí (SGEMM en todos los
+    # métodos, sin desbordar); los paneles de filas de A son contiguos y BLAS
+    # recorre B por filas sin copias internas (no-op si ya se convirtieron)
+    matrix_a = np.ascontiguousarray(matrix_a, dtype=np.float32)
+    matrix_b = np.ascontiguousarray(matrix_b, dtype=np.float32)
 
     # Información de matrices
     col1, col2, col3 = st.columns(3)
@@ -199,43 +249,117 @@ def execute_multiplication(matrix_size: int, workers_list: list, method: str, se
 
     # Ejecución secuencial
     st.subheader("1️⃣ Ejecución Secuencial (Baseline)")
-    with st.spinner("Ejecutando versión secuencial..."):
-        result_seq, time_seq = MatrixOperations.sequential_multiply(matrix_a, matrix_b)
+    if use_cached_baseline:
+        time_seq = st.session_state['time_seq']
+    else:
+        # Buffer de resultado persistente entre ejecuciones del mismo tamaño
+        result_buf = st.session_state.get('result_buf')
+        if result_buf is not None and result_buf.shape != (matrix_size, matrix_size):
+            result_buf = None
+
+        with st.spinner("Ejecutando versión secuencial..."):
+            result_buf, time_seq = MatrixOperations.sequential_multiply(
+                matrix_a, matrix_b, out=result_buf
+            )
+
+        st.session_state['result_buf'] = result_buf
+
+        st.session_state['baseline_key'] = baseline_key
+        st.session_state['matrix_a'] = matrix_a
+        st.session_state['matrix_b'] = matrix_b
+        st.session_state['time_seq'] = time_seq
 
     col1, col2 = st.columns(2)
     with col1:
         st.success(f"✅ **Tiempo secuencial:** {PerformanceMetrics.format_time(time_seq)}")
+        if use_cached_baseline:
+            st.caption("Baseline reutilizado de una ejecución anterior con la misma configuración")
     with col2:
         st.info(f"**Workers:** 1 (sin paralelización)")
 
+    # Vista previa en precisión reducida
+    if use_int8:
+        with st.spinner("Ejecutando versión cuantizada (int8)..."):
+            result_int8, time_int8 = MatrixOperations.quantized_multiply(matrix_a, matrix_b)
+
+        reference = st.session_state['result_buf']
+        relative_error = float(
+            np.max(np.abs(result_int8 - reference)) / (np.max(np.abs(reference)) or 1.0)
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.success(f"✅ **Tiempo int8:** {PerformanceMetrics.format_time(time_int8)} "
+                       f"({PerformanceMetrics.calculate_speedup(time_seq, time_int8):.2f}x)")
+        with col2:
+            st.warning(f"⚠️ **Resultado aproximado:** error relativo máximo "
+                       f"{relative_error:.2e} frente a float32")
+
     st.markdown("---")
 
     # Ejecución paralela
     st.subheader(f"2️⃣ Ejecución Paralela - {method}")
 
+    if method == "CUDA (cuBLAS)":
+        # La GPU se ejecuta una sola vez: el número de workers de CPU no aplica
+        st.info("La GPU no usa workers de CPU: se realiza una única ejecución")
+        workers_list = [1]
+
     results = {}
     progress_bar = st.progress(0)
     status_text = st.empty()
 
-    for idx, num_workers in enumerate(sorted(workers_list)):
-        status_text.text(f"Procesando con {num_workers} workers...")
-
-        with st.spinner(f"Ejecutando con {num_workers} workers..."):
-            if method == "Multiprocessing":
-                _, time_parallel = ParallelProcessor.parallel_multiply_processes(
-                    matrix_a, matrix_b, num_workers
-                )
-            elif method == "Threading":
-                _, time_parallel = ParallelProcessor.parallel_multiply_threads(
-                    matrix_a, matrix_b, num_workers
-                )
-            else:  # ProcessPoolExecutor
-                _, time_parallel = ParallelProcessor.parallel_multiply_executor(
-                    matrix_a, matrix_b, num_workers
-                )
-
-        results[num_workers] = time_parallel
-        progress_bar.progress((idx + 1) / len(workers_list))
+    # Un solo pool, del tamaño máximo, para todo el barrido (cada ejecución
+    # solo envía tantas tareas como workers pide)
+    max_workers = max(workers_list)
+    if method == "Multiprocessing":
+        ParallelProcessor.get_pool(max_workers)
+    elif method == "Threading":
+        ParallelProcessor.get_thread_pool(max_workers)
+    elif method == "ProcessPoolExecutor":
+        ParallelProcessor.get_executor(max_workers)
+
+    # Solo los métodos con procesos usan memoria compartida (los workers leen
+    # los operandos sin copiarlos); el resto trabaja sobre las matrices originales
+    shared_operands = []
+    try:
+        if method in ("Multiprocessing", "ProcessPoolExecutor"):
+            for matrix in (matrix_a, matrix_b):
+                shared_operands.append(SharedMatrix.from_array(matrix))
+            shared_a, shared_b = shared_operands
+
+        for idx, num_workers in enumerate(sorted(workers_list)):
+            status_text.text(f"Procesando con {num_workers} workers...")
+
+            with st.spinner(f"Ejecutando con {num_workers} workers..."):
+                if method == "Multiprocessing":
+                    _, time_parallel = ParallelProcessor.parallel_multiply_processes(
+                        shared_a, shared_b, num_workers
+                    )
+                elif method == "Threading":
+                    _, time_parallel = ParallelProcessor.parallel_multiply_threads(
+                        matrix_a, matrix_b, num_workers
+                    )
+                elif method == "BLAS multihilo":
+                    _, time_parallel = ParallelProcessor.parallel_multiply_blas(
+                        matrix_a, matrix_b, num_workers
+                    )
+                elif method == "Numba":
+                    _, time_parallel = MatrixOperations.numba_multiply(
+                        matrix_a, matrix_b, num_workers
+                    )
+                elif method == "CUDA (cuBLAS)":
+                    _, time_parallel = MatrixOperations.gpu_multiply(matrix_a, matrix_b)
+                else:  # ProcessPoolExecutor
+                    _, time_parallel = ParallelProcessor.parallel_multiply_executor(
+                        shared_a, shared_b, num_workers
+                    )
+
+            results[num_workers] = time_parallel
+            progress_bar.progress((idx + 1) / len(workers_list))
+    finally:
+        for shared in shared_operands:
+            shared.unlink()
 
     status_text.text("¡Ejecución completada!")
     st.success("✅ Todas las ejecuciones paralelas completadas")
@@ -339,6 +463,78 @@ def execute_multiplication(matrix_size: int, workers_list: list, method: str, se
     }
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_amdahl_figure(max_processors: int) -> 'go.Figure':
+    """
+    Construye el gráfico de la Ley de Amdahl para varias fracciones paralelas.
+    Se cachea porque Streamlit re-ejecuta el script en cada interacción.
+
+    Args:
+        max_processors: Número máximo de procesadores
+
+    Returns:
+        Figura de Plotly
+    """
+    import plotly.graph_objects as go
+
+    fig_amdahl = go.Figure()
+
+    # Diferentes fracciones paralelas, calculadas en una sola operación
+    fractions = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0]
+    processors = list(range(1, max_processors + 1))
+    speedup_grid = PerformanceMetrics.amdahl_grid(np.array(fractions), max_processors)
+
+    for frac, speedups in zip(fractions, speedup_grid):
+        fig_amdahl.add_trace(go.Scatter(
+            x=processors,
+            y=speedups,
+            mode='lines+markers',
+            name=f'P = {frac * 100:.0f}%',
+            line=dict(width=2),
+            marker=dict(size=6)
+        ))
+
+    # Línea ideal
+    fig_amdahl.add_trace(go.Scatter(
+        x=processors,
+        y=processors,
+        mode='lines',
+        line=dict(dash='dash', color='gray', width=2),
+        name='Speedup Lineal Ideal'
+    ))
+
+    fig_amdahl.update_layout(
+        title="Ley de Amdahl: Speedup vs Número de Procesadores",
+        xaxis_title="Número de Procesadores",
+        yaxis_title="Speedup",
+        height=500,
+        hovermode='x unified'
+    )
+
+    return fig_amdahl
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _amdahl_df(parallel_fraction: float, max_processors: int) -> 'pd.DataFrame':
+    """
+    Tabla de speedup teórico de Amdahl para una fracción paralela.
+
+    Args:
+        parallel_fraction: Fracción paralelizable
+        max_processors: Número máximo de procesadores
+
+    Returns:
+        DataFrame con columnas 'Procesadores' y 'Speedup Teórico'
+    """
+    import pandas as pd
+
+    speedups = PerformanceMetrics.calculate_amdahl_for_range(parallel_fraction, max_processors)
+    return pd.DataFrame({
+        'Procesadores': list(speedups.keys()),
+        'Speedup Teórico': list(speedups.values())
+    })
+
+
 def display_amdahl_analysis(workers_list: list):
     """
     Muestra análisis de la Ley de Amdahl.
@@ -346,6 +542,9 @@ def display_amdahl_analysis(workers_list: list):
     Args:
         workers_list: Lista de números de workers
     """
+    import pandas as pd
+    import plotly.graph_objects as go
+
     st.markdown('<p class="section-header">📈 Análisis de la Ley de Amdahl</p>',
                 unsafe_allow_html=True)
 
@@ -409,39 +608,7 @@ def display_amdahl_analysis(workers_list: list):
         st.metric("Speedup Máximo Teórico", f"{max_speedup:.2f}x")
 
     # Gráfico de Amdahl
-    fig_amdahl = go.Figure()
-
-    # Diferentes fracciones paralelas
-    fractions = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1.0]
-    colors = px.colors.sequential.Viridis
-
-    for idx, frac in enumerate(fractions):
-        speedups = PerformanceMetrics.calculate_amdahl_for_range(frac, max_processors)
-        fig_amdahl.add_trace(go.Scatter(
-            x=list(speedups.keys()),
-            y=list(speedups.values()),
-            mode='lines+markers',
-            name=f'P = {frac * 100:.0f}%',
-            line=dict(width=2),
-            marker=dict(size=6)
-        ))
-
-    # Línea ideal
-    fig_amdahl.add_trace(go.Scatter(
-        x=list(range(1, max_processors + 1)),
-        y=list(range(1, max_processors + 1)),
-        mode='lines',
-        line=dict(dash='dash', color='gray', width=2),
-        name='Speedup Lineal Ideal'
-    ))
-
-    fig_amdahl.update_layout(
-        title="Ley de Amdahl: Speedup vs Número de Procesadores",
-        xaxis_title="Número de Procesadores",
-        yaxis_title="Speedup",
-        height=500,
-        hovermode='x unified'
-    )
+    fig_amdahl = _build_amdahl_figure(max_processors)
 
     st.plotly_chart(fig_amdahl, use_container_width=True)
 
@@ -456,11 +623,8 @@ def display_amdahl_analysis(workers_list: list):
 
     with col1:
         st.markdown("**🔵 Paralelismo del 60% (P = 0.6)**")
-        speedups_60 = PerformanceMetrics.calculate_amdahl_for_range(0.6, 8)
-        df_60 = pd.DataFrame({
-            'Procesadores': list(speedups_60.keys()),
-            'Speedup Teórico': list(speedups_60.values())
-        })
+        df_60 = _amdahl_df(0.6, 8)
+        speedups_60 = dict(zip(df_60['Procesadores'], df_60['Speedup Teórico']))
         st.dataframe(df_60.style.format({'Speedup Teórico': '{:.3f}x'}),
                      use_container_width=True)
 
@@ -469,11 +633,8 @@ def display_amdahl_analysis(workers_list: list):
 
     with col2:
         st.markdown("**🟢 Paralelismo del 90% (P = 0.9)**")
-        speedups_90 = PerformanceMetrics.calculate_amdahl_for_range(0.9, 8)
-        df_90 = pd.DataFrame({
-            'Procesadores': list(speedups_90.keys()),
-            'Speedup Teórico': list(speedups_90.values())
-        })
+        df_90 = _amdahl_df(0.9, 8)
+        speedups_90 = dict(zip(df_90['Procesadores'], df_90['Speedup Teórico']))
         st.dataframe(df_90.style.format({'Speedup Teórico': '{:.3f}x'}),
                      use_container_width=True)
 
@@ -531,11 +692,17 @@ def display_amdahl_analysis(workers_list: list):
 
         st.plotly_chart(fig_comparison, use_container_width=True)
 
-        st.markdown(df_comparison.style.format({
+        st.dataframe(df_comparison.style.format({
             'Speedup Real': '{:.3f}x',
             'Amdahl 60%': '{:.3f}x',
             'Amdahl 90%': '{:.3f}x'
-        }).to_html(), unsafe_allow_html=True)
+        }), use_container_width=True)
+
+
+@st.cache_resource(show_spinner=False)
+def _flynn_info() -> dict:
+    """Información estática de la Taxonomía de Flynn, construida una sola vez."""
+    return PerformanceMetrics.get_flynn_taxonomy()
 
 
 def display_flynn_taxonomy():
@@ -543,7 +710,7 @@ def display_flynn_taxonomy():
     st.markdown('<p class="section-header">🏛️ Taxonomía de Flynn</p>',
                 unsafe_allow_html=True)
 
-    flynn_info = PerformanceMetrics.get_flynn_taxonomy()
+    flynn_info = _flynn_info()
 
     st.markdown("#### Pregunta: ¿Qué arquitectura de Flynn se utilizó en este ejercicio?")
 
@@ -644,7 +811,8 @@ def display_flynn_taxonomy():
     # Características del sistema usado
     st.subheader("💻 Características del Sistema Usado en Este Ejercicio")
 
-    system_info = get_system_info()
+    # Solo se muestran campos numéricos: no hace falta formatear nada
+    system_info = get_system_info_raw()
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -708,23 +876,37 @@ def display_information():
 
     ### 📊 Métodos de Paralelización
 
-    #### 1. Multiprocessing (Recomendado)
+    #### 1. Threading (Recomendado)
+    - Utiliza múltiples hilos dentro de un proceso
+    - `np.matmul` libera el GIL durante el cálculo en BLAS: paralelismo real
+    - Sin creación de procesos ni copia de matrices entre ellos
+    - Mejor rendimiento para este problema
+
+    #### 2. Multiprocessing
     - Utiliza múltiples procesos del sistema operativo
     - Verdadero paralelismo (múltiples CPUs)
     - Evita el GIL (Global Interpreter Lock) de Python
-    - Mejor rendimiento para operaciones CPU-intensive
-
-    #### 2. Threading
-    - Utiliza múltiples hilos dentro de un proceso
-    - Limitado por el GIL en Python
-    - Incluido para comparación educativa
-    - Puede ser útil para operaciones I/O-bound
+    - Alternativa para kernels en Python puro que retienen el GIL
 
     #### 3. ProcessPoolExecutor
     - API moderna para manejo de procesos
     - Similar a Multiprocessing pero con interfaz más limpia
     - Parte del módulo concurrent.futures
 
+    #### 4. BLAS multihilo
+    - Un único `np.matmul` sin dividir la matriz en chunks
+    - OpenBLAS/MKL reparte el cálculo entre sus propios hilos nativos
+    - Micro-kernels vectorizados y bloqueo de caché: suele ser el más rápido
+
+    #### 5. Numba
+    - Kernel de multiplicación compilado a código nativo (no usa BLAS)
+    - Reparte las filas del resultado entre hilos con `prange`, sin GIL
+    - Se compila al iniciar, fuera de la medición
+
+    #### 6. CUDA (cuBLAS)
+    - Solo visible si CuPy y una GPU NVIDIA están disponibles
+    - Multiplicación SGEMM en la GPU; las copias de memoria no se miden
+
     ### 🎯 Objetivos del Ejercicio
 
     ✅ Implementar multiplicación de matrices paralela
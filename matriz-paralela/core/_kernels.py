@@ -0,0 +1,76 @@
+"""
+Kernels de Numba para los workers de ParallelProcessor.
+Módulo aparte y ligero: los procesos worker lo importan sin arrastrar los
+kernels paralelos de matrix_operations (ni su runtime de hilos).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Tipos enteros con kernel compilado; el resto usa np.matmul
+INT_KERNEL_DTYPES = (np.dtype(np.int32), np.dtype(np.int64))
+
+
+if NUMBA_AVAILABLE:
+    # Compilación anticipada (firmas explícitas) y en caché de disco: la
+    # primera llamada dentro de una región medida no paga el JIT.
+    # Sin prange: el paralelismo lo ponen los hilos/procesos que reparten
+    # los chunks, igual que BLAS limitado a un hilo por worker.
+    @njit(
+        [
+            "void(int32[:, ::1], int32[:, ::1], int32[:, ::1])",
+            "void(int64[:, ::1], int64[:, ::1], int64[:, ::1])",
+        ],
+        nogil=True,
+        cache=True,
+    )
+    def _matmul_int_kernel(matrix_a, matrix_b, result):
+        """Multiplicación entera ikj: recorre las filas de B de forma contigua."""
+        for i in range(matrix_a.shape[0]):
+            for j in range(matrix_b.shape[1]):
+                result[i, j] = 0
+            for k in range(matrix_a.shape[1]):
+                a = matrix_a[i, k]
+                for j in range(matrix_b.shape[1]):
+                    result[i, j] += a * matrix_b[k, j]
+
+
+def supports_int_matmul(matrix_a: np.ndarray, matrix_b: np.ndarray, out: np.ndarray) -> bool:
+    """
+    Indica si el kernel entero puede calcular out = matrix_a @ matrix_b.
+
+    Args:
+        matrix_a: Primera matriz (m x n)
+        matrix_b: Segunda matriz (n x p)
+        out: Matriz resultado (m x p)
+
+    Returns:
+        True si Numba está disponible y las tres matrices son C-contiguas
+        del mismo tipo entero compilado
+    """
+    return (
+        NUMBA_AVAILABLE
+        and matrix_a.dtype in INT_KERNEL_DTYPES
+        and matrix_a.dtype == matrix_b.dtype == out.dtype
+        and matrix_a.flags.c_contiguous
+        and matrix_b.flags.c_contiguous
+        and out.flags.c_contiguous
+    )
+
+
+def matmul_int(matrix_a: np.ndarray, matrix_b: np.ndarray, out: np.ndarray):
+    """
+    Multiplicación entera compilada: escribe matrix_a @ matrix_b en out.
+    Libera el GIL, así que varios hilos pueden ejecutarla en paralelo.
+
+    Args:
+        matrix_a: Primera matriz (m x n)
+        matrix_b: Segunda matriz (n x p)
+        out: Matriz resultado (m x p); no necesita estar inicializada
+    """
+    _matmul_int_kernel(matrix_a, matrix_b, out)
@@ -5,34 +5,360 @@ Implementa multiplicación de matrices secuencial y paralela.
 
 import numpy as np
 import time
-from typing import Tuple
+import threading
+from functools import lru_cache
+from typing import Tuple, Callable
+from threadpoolctl import threadpool_limits
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import cupy as cp
+    CUDA_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    # CuPy no instalado o sin dispositivo/driver CUDA
+    cp = None
+    CUDA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_matmul_kernel(matrix_a, matrix_b, result):
+        """Multiplicación ikj con las filas de A repartidas entre hilos (prange)."""
+        for i in prange(matrix_a.shape[0]):
+            for k in range(matrix_a.shape[1]):
+                a = matrix_a[i, k]
+                for j in range(matrix_b.shape[1]):
+                    result[i, j] += a * matrix_b[k, j]
+
+    # Compilar al importar, fuera de cualquier región medida
+    _numba_matmul_kernel(
+        np.ones((2, 2), dtype=np.float32),
+        np.ones((2, 2), dtype=np.float32),
+        np.zeros((2, 2), dtype=np.float32)
+    )
+
+
+# Kernels de Numba especializados por tamaño: {N: kernel compilado}
+_KERNELS = {}
+_KERNELS_LOCK = threading.Lock()
+# Tamaños cuyo kernel se está compilando en segundo plano (protegido por _KERNELS_LOCK)
+_KERNELS_COMPILING = set()
 
 
 class MatrixOperations:
     """Clase para operaciones de multiplicación de matrices."""
 
     @staticmethod
-    def generate_random_matrix(rows: int, cols: int, seed: int = None) -> np.ndarray:
+    def generate_random_matrix(
+        rows: int,
+        cols: int,
+        rng: np.random.Generator = None
+    ) -> np.ndarray:
         """
-        Genera una matriz aleatoria con valores entre 0 y 100.
+        Genera una matriz aleatoria int8 con valores enteros entre 0 y 99.
+        El rango solo necesita 7 bits: int8 ocupa 1/4 de memoria que int32/float32.
+        Convertir a float32 antes de multiplicar para usar BLAS (SGEMM) y
+        evitar el desbordamiento de la acumulación en int8.
 
         Args:
             rows: Número de filas
             cols: Número de columnas
-            seed: Semilla para reproducibilidad
+            rng: Generador aleatorio (PCG64) a usar; si es None se crea uno nuevo
 
         Returns:
             Matriz NumPy de tamaño (rows, cols)
         """
-        if seed is not None:
-            np.random.seed(seed)
+        if rng is None:
+            rng = np.random.default_rng()
+
+        return rng.integers(0, 100, size=(rows, cols), dtype=np.int8)
+
+    @staticmethod
+    def generate_matrix_pair(
+        rows: int,
+        cols: int,
+        seed: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Genera las matrices A y B desde un único generador.
+        Ambas salen de posiciones consecutivas del mismo flujo, así que son
+        distintas y reproducibles con la misma semilla.
 
-        return np.random.randint(0, 100, size=(rows, cols), dtype=np.int32)
+        Args:
+            rows: Número de filas
+            cols: Número de columnas
+            seed: Semilla para reproducibilidad
+
+        Returns:
+            Tupla (matrix_a, matrix_b)
+        """
+        rng = np.random.default_rng(seed)
+
+        matrix_a = MatrixOperations.generate_random_matrix(rows, cols, rng)
+        matrix_b = MatrixOperations.generate_random_matrix(rows, cols, rng)
+
+        return matrix_a, matrix_b
 
     @staticmethod
-    def sequential_multiply(matrix_a: np.ndarray, matrix_b: np.ndarray) -> Tuple[np.ndarray, float]:
+    def sequential_multiply(
+        matrix_a: np.ndarray,
+        matrix_b: np.ndarray,
+        out: np.ndarray = None
+    ) -> Tuple[np.ndarray, float]:
         """
         Multiplicación de matrices secuencial usando NumPy optimizado.
+        Las matrices enteras se convierten a float32, ya que np.matmul
+        sobre enteros no usa BLAS sino un bucle genérico mucho más lento.
+        BLAS se limita a un hilo para que el baseline sea realmente secuencial.
+
+        Args:
+            matrix_a: Primera matriz (m x n)
+            matrix_b: Segunda matriz (n x p)
+            out: Buffer (m x p) donde escribir el resultado; reutilizarlo entre
+                 llamadas evita reservar y pre-tocar N² elementos cada vez
+
+        Returns:
+            Tupla (matriz resultado, tiempo de ejecución en segundos)
+        """
+        if matrix_a.shape[1] != matrix_b.shape[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+        # Convertir enteros a float32 para usar BLAS (SGEMM)
+        if matrix_a.dtype.kind in 'iu':
+            matrix_a = matrix_a.astype(np.float32, copy=False)
+        if matrix_b.dtype.kind in 'iu':
+            matrix_b = matrix_b.astype(np.float32, copy=False)
+
+        result_shape = (matrix_a.shape[0], matrix_b.shape[1])
+        result_dtype = np.result_type(matrix_a, matrix_b)
+
+        if out is None:
+            # Pre-tocar el buffer de salida para no medir los fallos de página
+            result = np.empty(result_shape, dtype=result_dtype)
+            result.fill(0)
+        elif out.shape != result_shape or out.dtype != result_dtype:
+            raise ValueError(
+                f"Buffer de salida incompatible: {out.shape} {out.dtype}, "
+                f"se esperaba {result_shape} {result_dtype}"
+            )
+        else:
+            result = out
+
+        # BLAS limitado a un hilo: el baseline debe ser realmente secuencial
+        with threadpool_limits(limits=1, user_api='blas'):
+            # Calentamiento fuera de la medición
+            np.matmul(matrix_a[:64, :64], matrix_b[:64, :64])
+
+            start_time = time.perf_counter()
+            np.matmul(matrix_a, matrix_b, out=result)
+            end_time = time.perf_counter()
+
+        execution_time = end_time - start_time
+
+        return result, execution_time
+
+    @staticmethod
+    def _strassen(matrix_a: np.ndarray, matrix_b: np.ndarray, min_size: int) -> np.ndarray:
+        """
+        Paso recursivo de Strassen: 7 productos de cuadrantes en lugar de 8.
+        Por debajo de min_size delega en np.matmul (BLAS).
+
+        Args:
+            matrix_a: Primera matriz (m x n)
+            matrix_b: Segunda matriz (n x p)
+            min_size: Tamaño a partir del cual se deja de subdividir
+
+        Returns:
+            Matriz resultado (m x p)
+        """
+        m, n = matrix_a.shape
+        p = matrix_b.shape[1]
+
+        if min(m, n, p) <= min_size:
+            return np.matmul(matrix_a, matrix_b)
+
+        # Rellenar con una fila/columna de ceros si alguna dimensión es impar
+        if m % 2 or n % 2 or p % 2:
+            matrix_a = np.pad(matrix_a, ((0, m % 2), (0, n % 2)))
+            matrix_b = np.pad(matrix_b, ((0, n % 2), (0, p % 2)))
+
+        h_m = matrix_a.shape[0] // 2
+        h_n = matrix_a.shape[1] // 2
+        h_p = matrix_b.shape[1] // 2
+
+        # Cuadrantes como vistas (sin copia)
+        a11, a12 = matrix_a[:h_m, :h_n], matrix_a[:h_m, h_n:]
+        a21, a22 = matrix_a[h_m:, :h_n], matrix_a[h_m:, h_n:]
+        b11, b12 = matrix_b[:h_n, :h_p], matrix_b[:h_n, h_p:]
+        b21, b22 = matrix_b[h_n:, :h_p], matrix_b[h_n:, h_p:]
+
+        strassen = MatrixOperations._strassen
+        m1 = strassen(a11 + a22, b11 + b22, min_size)
+        m2 = strassen(a21 + a22, b11, min_size)
+        m3 = strassen(a11, b12 - b22, min_size)
+        m4 = strassen(a22, b21 - b11, min_size)
+        m5 = strassen(a11 + a12, b22, min_size)
+        m6 = strassen(a21 - a11, b11 + b12, min_size)
+        m7 = strassen(a12 - a22, b21 + b22, min_size)
+
+        # Ensamblar los cuadrantes de C directamente en su destino
+        result = np.empty((2 * h_m, 2 * h_p), dtype=m1.dtype)
+        c11, c12 = result[:h_m, :h_p], result[:h_m, h_p:]
+        c21, c22 = result[h_m:, :h_p], result[h_m:, h_p:]
+
+        np.add(m1, m4, out=c11)
+        np.subtract(c11, m5, out=c11)
+        np.add(c11, m7, out=c11)
+
+        np.add(m3, m5, out=c12)
+
+        np.add(m2, m4, out=c21)
+
+        np.subtract(m1, m2, out=c22)
+        np.add(c22, m3, out=c22)
+        np.add(c22, m6, out=c22)
+
+        return result[:m, :p]
+
+    @staticmethod
+    def strassen_multiply(
+        matrix_a: np.ndarray,
+        matrix_b: np.ndarray,
+        min_size: int = 512
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Multiplicación con el algoritmo de Strassen sobre BLAS.
+        Cada nivel de recursión sustituye 1 de 8 productos de la mitad de tamaño
+        por 18 sumas (~12.5% menos FLOPs por nivel); útil para N >= 1024.
+
+        Args:
+            matrix_a: Primera matriz (m x n)
+            matrix_b: Segunda matriz (n x p)
+            min_size: Tamaño a partir del cual se usa np.matmul directamente
+
+        Returns:
+            Tupla (matriz resultado, tiempo de ejecución en segundos)
+        """
+        if matrix_a.shape[1] != matrix_b.shape[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+        if matrix_a.dtype.kind in 'iu':
+            matrix_a = matrix_a.astype(np.float32, copy=False)
+        if matrix_b.dtype.kind in 'iu':
+            matrix_b = matrix_b.astype(np.float32, copy=False)
+
+        # Misma configuración de BLAS que el baseline secuencial
+        with threadpool_limits(limits=1, user_api='blas'):
+            start_time = time.perf_counter()
+            result = MatrixOperations._strassen(matrix_a, matrix_b, min_size)
+            end_time = time.perf_counter()
+
+        execution_time = end_time - start_time
+
+        return np.ascontiguousarray(result), execution_time
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def int8_matmul_available() -> bool:
+        """
+        Indica si hay un kernel int8 nativo (torch._int_mm de PyTorch).
+        PyTorch es opcional: se importa solo la primera vez que se consulta.
+
+        Returns:
+            True si torch está instalado y expone _int_mm
+        """
+        try:
+            import torch
+        except ImportError:
+            return False
+
+        return hasattr(torch, '_int_mm')
+
+    @staticmethod
+    def quantized_multiply(
+        matrix_a: np.ndarray,
+        matrix_b: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Multiplicación aproximada en int8 (precisión reducida).
+        Cuantiza cada matriz a [-127, 127] con una escala simétrica, multiplica
+        en int8 acumulando en int32 y des-cuantiza el resultado a float32.
+        Con PyTorch disponible usa torch._int_mm (VNNI/AMX en CPUs Intel);
+        si no, SGEMM en float32 sobre los valores cuantizados (np.matmul sobre
+        enteros no usa BLAS y sería mucho más lento que el baseline).
+        En ambos casos solo se mide el producto: la cuantización y la
+        des-cuantización quedan fuera de la medición.
+
+        Args:
+            matrix_a: Primera matriz (m x n)
+            matrix_b: Segunda matriz (n x p)
+
+        Returns:
+            Tupla (matriz resultado aproximada, tiempo de ejecución en segundos)
+        """
+        if matrix_a.shape[1] != matrix_b.shape[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+        # Cuantización (preprocesado) fuera de la medición
+        scale_a = float(np.max(np.abs(matrix_a))) / 127 or 1.0
+        scale_b = float(np.max(np.abs(matrix_b))) / 127 or 1.0
+        a_int8 = np.round(matrix_a / scale_a).astype(np.int8)
+        b_int8 = np.round(matrix_b / scale_b).astype(np.int8)
+
+        product = None
+        if MatrixOperations.int8_matmul_available():
+            import torch
+
+            tensor_a = torch.from_numpy(a_int8)
+            tensor_b = torch.from_numpy(b_int8)
+
+            try:
+                start_time = time.perf_counter()
+                product = torch._int_mm(tensor_a, tensor_b)
+                end_time = time.perf_counter()
+                product = product.numpy()
+            except RuntimeError:
+                # Formas o backend no soportados por el kernel int8
+                product = None
+
+        if product is None:
+            # Respaldo con BLAS: float32 representa exactamente los valores int8
+            a_float = a_int8.astype(np.float32)
+            b_float = b_int8.astype(np.float32)
+
+            with threadpool_limits(limits=1, user_api='blas'):
+                start_time = time.perf_counter()
+                product = np.matmul(a_float, b_float)
+                end_time = time.perf_counter()
+
+        # Des-cuantización fuera de la medición
+        result = product.astype(np.float32, copy=False) * np.float32(scale_a * scale_b)
+
+        execution_time = end_time - start_time
+
+        return result, execution_time
+
+    @staticmethod
+    def gpu_multiply(
+        matrix_a: np.ndarray,
+        matrix_b: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Multiplicación en GPU con CuPy (cuBLAS).
+        Las copias host/dispositivo quedan fuera de la medición; el tiempo
+        corresponde solo al producto, sincronizando el stream antes y después.
 
         Args:
             matrix_a: Primera matriz (m x n)
@@ -41,17 +367,162 @@ class MatrixOperations:
         Returns:
             Tupla (matriz resultado, tiempo de ejecución en segundos)
         """
+        if not CUDA_AVAILABLE:
+            raise RuntimeError("CuPy o un dispositivo CUDA no están disponibles")
+
         if matrix_a.shape[1] != matrix_b.shape[0]:
             raise ValueError(
                 f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
             )
 
+        if matrix_a.dtype.kind in 'iu':
+            matrix_a = matrix_a.astype(np.float32, copy=False)
+        if matrix_b.dtype.kind in 'iu':
+            matrix_b = matrix_b.astype(np.float32, copy=False)
+
+        a_device = cp.asarray(matrix_a)
+        b_device = cp.asarray(matrix_b)
+
+        # Calentamiento: creación del handle de cuBLAS fuera de la medición
+        a_device[:64, :64] @ b_device[:64, :64]
+        cp.cuda.Stream.null.synchronize()
+
         start_time = time.perf_counter()
-        result = np.matmul(matrix_a, matrix_b)
+        result_device = a_device @ b_device
+        cp.cuda.Stream.null.synchronize()
         end_time = time.perf_counter()
 
         execution_time = end_time - start_time
 
+        return cp.asnumpy(result_device), execution_time
+
+    @staticmethod
+    def get_numba_kernel(size: int) -> Callable:
+        """
+        Devuelve un kernel de Numba compilado para matrices N x N fijas.
+        Con N constante en compilación, LLVM conoce los límites de todos los
+        bucles y puede vectorizar y desenrollar sin código para colas genéricas.
+        El kernel se compila una vez por tamaño y se guarda en _KERNELS.
+
+        Args:
+            size: Tamaño N de las matrices cuadradas
+
+        Returns:
+            Kernel kernel(matrix_a, matrix_b, result) para float32 contiguo
+        """
+        if not NUMBA_AVAILABLE:
+            raise RuntimeError("Numba no está instalado")
+
+        with _KERNELS_LOCK:
+            if size not in _KERNELS:
+                # Firma explícita: compilación inmediata, sin ejecutar el kernel
+                @njit(
+                    "void(float32[:, ::1], float32[:, ::1], float32[:, ::1])",
+                    parallel=True,
+                    fastmath=True
+                )
+                def kernel(matrix_a, matrix_b, result):
+                    for i in prange(size):
+                        for k in range(size):
+                            a = matrix_a[i, k]
+                            for j in range(size):
+                                result[i, j] += a * matrix_b[k, j]
+
+                _KERNELS[size] = kernel
+
+            return _KERNELS[size]
+
+    @staticmethod
+    def prewarm_numba_kernel(size: int):
+        """
+        Compila en segundo plano el kernel especializado para N x N, de modo
+        que el coste del JIT no caiga dentro de la región medida.
+
+        Args:
+            size: Tamaño N de las matrices cuadradas
+        """
+        if not NUMBA_AVAILABLE:
+            return
+
+        # Cada rerun de Streamlit vuelve a llamar aquí: no lanzar otro hilo
+        # si el kernel ya está compilado o compilándose
+        with _KERNELS_LOCK:
+            if size in _KERNELS or size in _KERNELS_COMPILING:
+                return
+            _KERNELS_COMPILING.add(size)
+
+        threading.Thread(
+            target=MatrixOperations._compile_numba_kernel,
+            args=(size,),
+            daemon=True
+        ).start()
+
+    @staticmethod
+    def _compile_numba_kernel(size: int):
+        """
+        Compila el kernel de size en segundo plano y lo retira de los
+        tamaños en compilación al terminar.
+
+        Args:
+            size: Tamaño N de las matrices cuadradas
+        """
+        try:
+            MatrixOperations.get_numba_kernel(size)
+        finally:
+            with _KERNELS_LOCK:
+                _KERNELS_COMPILING.discard(size)
+
+    @staticmethod
+    def numba_multiply(
+        matrix_a: np.ndarray,
+        matrix_b: np.ndarray,
+        num_threads: int
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Multiplicación paralela con un kernel compilado por Numba.
+        A diferencia de los demás métodos no usa BLAS: las filas del resultado
+        se reparten entre hilos nativos que no están sujetos al GIL.
+        Para matrices cuadradas se usa el kernel especializado para su tamaño.
+
+        Args:
+            matrix_a: Primera matriz (m x n)
+            matrix_b: Segunda matriz (n x p)
+            num_threads: Número de hilos de Numba
+
+        Returns:
+            Tupla (matriz resultado, tiempo de ejecución en segundos)
+        """
+        if not NUMBA_AVAILABLE:
+            raise RuntimeError("Numba no está instalado")
+
+        if matrix_a.shape[1] != matrix_b.shape[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+        # El kernel se compiló para float32 contiguo
+        matrix_a = np.ascontiguousarray(matrix_a, dtype=np.float32)
+        matrix_b = np.ascontiguousarray(matrix_b, dtype=np.float32)
+        result = np.zeros((matrix_a.shape[0], matrix_b.shape[1]), dtype=np.float32)
+
+        size = matrix_a.shape[0]
+        if matrix_a.shape == matrix_b.shape == (size, size):
+            kernel = MatrixOperations.get_numba_kernel(size)
+        else:
+            kernel = _numba_matmul_kernel
+
+        previous_threads = numba.get_num_threads()
+        numba.set_num_threads(min(num_threads, numba.config.NUMBA_NUM_THREADS))
+
+        try:
+            start_time = time.perf_counter()
+            kernel(matrix_a, matrix_b, result)
+            end_time = time.perf_counter()
+        finally:
+            numba.set_num_threads(previous_threads)
+
+        execution_time = end_time - start_time
+
         return result, execution_time
 
     @staticmethod
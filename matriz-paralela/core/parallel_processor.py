@@ -5,10 +5,100 @@ Implementa paralelización usando multiprocessing y threading.
 
 import numpy as np
 import time
-from multiprocessing import Pool, cpu_count
+import atexit
+import threading
+from multiprocessing import cpu_count, get_context, get_all_start_methods
+from multiprocessing.pool import Pool as PoolType
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
-from typing import Tuple, List
+from typing import Tuple, List, Union, Dict, Any
+from functools import lru_cache
 import os
+from threadpoolctl import threadpool_limits, ThreadpoolController
+from core.shared_matrix import SharedMatrix
+from utils.helpers import effective_cpus
+from core._kernels import supports_int_matmul, matmul_int
+
+# Una matriz puede pasarse como ndarray o ya alojada en memoria compartida
+Matrix = Union[np.ndarray, SharedMatrix]
+
+# Un único pool persistente por tipo ('process', 'executor', 'thread') como
+# tupla (tamaño, pool): se crea fuera de las regiones medidas y solo se
+# reemplaza si se pide uno mayor. Cada ejecución envía exactamente tantas
+# tareas como workers pide, así que nunca hay más workers activos que esos
+_POOLS: Dict[str, Tuple[int, Any]] = {}
+_pool_lock = threading.Lock()
+
+# Controlador de BLAS creado una vez: threadpool_limits() vuelve a inspeccionar
+# las bibliotecas cargadas en cada llamada (~0.4 ms), controller.limit() no
+_BLAS_CONTROLLER = ThreadpoolController()
+
+# Alineación (bytes) de los buffers que se pasan a BLAS: una línea de caché
+ALIGNMENT = 64
+
+# Con forkserver los workers parten de un proceso limpio en lugar de hacer fork
+# del proceso principal: hacer fork de un proceso con hilos ya en marcha (p. ej.
+# los de la capa de hilos de Numba, TBB/OpenMP) puede dejar al hijo bloqueado.
+# El forkserver importa el script principal como __mp_main__, así que este debe
+# mantener la guarda if __name__ == "__main__" (app.py la tiene)
+_MP_CONTEXT = get_context(
+    'forkserver' if 'forkserver' in get_all_start_methods() else None
+)
+
+
+def _multiply_chunk(args: Tuple):
+    """
+    Multiplica un chunk (porción) de la matriz A con toda la matriz B.
+    El resultado se escribe directamente en las filas correspondientes
+    de la matriz de salida, sin devolver ni concatenar chunks.
+
+    Args:
+        args: Tupla (a, b, salida, fila_inicio, fila_fin); a, b y salida
+              son matrices o descriptores de memoria compartida
+    """
+    *refs, start, stop = args
+    attached = [
+        SharedMatrix.attach(ref) if isinstance(ref, tuple) else None
+        for ref in refs
+    ]
+
+    try:
+        matrix_a, matrix_b, out = [
+            shared.array if shared is not None else ref
+            for shared, ref in zip(attached, refs)
+        ]
+        chunk_a = matrix_a[start:stop]
+        chunk_out = out[start:stop]
+
+        # Enteros: kernel compilado de Numba (np.matmul no usa BLAS con enteros).
+        # Con operandos 2-D, ndarray.dot evita el despacho por dimensiones
+        # y broadcasting de np.matmul
+        if supports_int_matmul(chunk_a, matrix_b, chunk_out):
+            matmul_int(chunk_a, matrix_b, chunk_out)
+        else:
+            chunk_a.dot(matrix_b, out=chunk_out)
+
+        # Soltar las vistas antes de cerrar la memoria compartida
+        del matrix_a, matrix_b, out, chunk_a, chunk_out
+    finally:
+        for shared in attached:
+            if shared is not None:
+                shared.close()
+
+
+@lru_cache(maxsize=1)
+def _cpu_info() -> Dict:
+    """
+    Consulta una sola vez la información de CPUs, que no cambia durante la
+    ejecución. No se expone directamente: get_cpu_info devuelve una copia.
+
+    Returns:
+        Diccionario con información de CPUs
+    """
+    return {
+        'cpu_count': cpu_count(),
+        'available_cores': os.cpu_count(),
+        'effective_cores': effective_cpus(),
+    }
 
 
 class ParallelProcessor:
@@ -18,68 +108,383 @@ class ParallelProcessor:
     def get_cpu_info() -> dict:
         """
         Obtiene información de CPUs disponibles.
+        No cambia durante la ejecución, así que se calcula una sola vez.
 
         Returns:
-            Diccionario con información de CPUs
+            Diccionario nuevo con información de CPUs (modificarlo no
+            altera los valores en caché)
         """
-        return {
-            'cpu_count': cpu_count(),
-            'available_cores': os.cpu_count(),
-        }
+        return dict(_cpu_info())
+
+    @staticmethod
+    def limit_worker_blas(num_threads: int):
+        """
+        Inicializador de procesos worker: limita los hilos de BLAS.
+        Con un hilo por worker, N workers usan N núcleos y el speedup
+        medido refleja solo la paralelización propia (sin sobresuscripción).
+
+        Args:
+            num_threads: Número de hilos de BLAS por worker
+        """
+        threadpool_limits(limits=num_threads, user_api='blas')
+
+    @staticmethod
+    def _get_shared_pool(kind: str, size: int, create, shutdown):
+        """
+        Devuelve el pool persistente de un tipo con al menos size workers.
+        Si el actual es menor, se cierra y se crea uno de tamaño size: nunca
+        hay más de un pool vivo por tipo.
+
+        Args:
+            kind: Tipo de pool ('process', 'executor' o 'thread')
+            size: Número mínimo de workers
+            create: Función que crea (y arranca) un pool de size workers
+            shutdown: Función que cierra un pool
+
+        Returns:
+            Pool persistente del tipo indicado
+        """
+        with _pool_lock:
+            current_size, pool = _POOLS.get(kind, (0, None))
+            if current_size < size:
+                if pool is not None:
+                    shutdown(pool)
+                pool = create(size)
+                _POOLS[kind] = (size, pool)
+
+            return pool
+
+    @staticmethod
+    def _create_pool(num_processes: int) -> PoolType:
+        """Crea un multiprocessing.Pool y espera a que arranquen sus procesos."""
+        pool = _MP_CONTEXT.Pool(
+            processes=num_processes,
+            initializer=ParallelProcessor.limit_worker_blas,
+            initargs=(1,)
+        )
+        pool.map(time.sleep, [0.05] * num_processes, chunksize=1)
+        return pool
+
+    @staticmethod
+    def _create_executor(num_workers: int) -> ProcessPoolExecutor:
+        """Crea un ProcessPoolExecutor y lanza todos sus procesos."""
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=_MP_CONTEXT,
+            initializer=ParallelProcessor.limit_worker_blas,
+            initargs=(1,)
+        )
+        # Los procesos se lanzan en el primer submit: forzarlo ahora
+        list(executor.map(time.sleep, [0.05] * num_workers))
+        return executor
+
+    @staticmethod
+    def _create_thread_pool(num_threads: int) -> ThreadPoolExecutor:
+        """Crea un ThreadPoolExecutor y lanza todos sus hilos."""
+        executor = ThreadPoolExecutor(max_workers=num_threads)
+        # Los hilos se lanzan en el primer submit: forzarlo ahora
+        list(executor.map(time.sleep, [0.05] * num_threads))
+        return executor
+
+    @staticmethod
+    def _shutdown_executor(executor):
+        """Cierra un executor sin esperar a las tareas pendientes."""
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def get_pool(num_processes: int) -> PoolType:
+        """
+        Devuelve el multiprocessing.Pool persistente, con al menos
+        num_processes procesos ya arrancados.
+
+        Args:
+            num_processes: Número mínimo de procesos del pool
+
+        Returns:
+            Pool con BLAS limitado a un hilo por proceso
+        """
+        return ParallelProcessor._get_shared_pool(
+            'process', num_processes,
+            ParallelProcessor._create_pool, PoolType.terminate
+        )
+
+    @staticmethod
+    def get_executor(num_workers: int) -> ProcessPoolExecutor:
+        """
+        Devuelve el ProcessPoolExecutor persistente, con al menos
+        num_workers procesos ya arrancados.
+
+        Args:
+            num_workers: Número mínimo de procesos del executor
+
+        Returns:
+            ProcessPoolExecutor con BLAS limitado a un hilo por proceso
+        """
+        return ParallelProcessor._get_shared_pool(
+            'executor', num_workers,
+            ParallelProcessor._create_executor, ParallelProcessor._shutdown_executor
+        )
+
+    @staticmethod
+    def get_thread_pool(num_threads: int) -> ThreadPoolExecutor:
+        """
+        Devuelve el ThreadPoolExecutor persistente, con al menos
+        num_threads hilos ya arrancados.
+
+        Args:
+            num_threads: Número mínimo de hilos del pool
+
+        Returns:
+            ThreadPoolExecutor reutilizable entre llamadas
+        """
+        return ParallelProcessor._get_shared_pool(
+            'thread', num_threads,
+            ParallelProcessor._create_thread_pool, ParallelProcessor._shutdown_executor
+        )
+
+    @staticmethod
+    def shutdown_pools():
+        """Termina todos los pools persistentes (registrado con atexit)."""
+        with _pool_lock:
+            for kind, (_, pool) in _POOLS.items():
+                if kind == 'process':
+                    pool.terminate()
+                else:
+                    ParallelProcessor._shutdown_executor(pool)
+            _POOLS.clear()
+
+    @staticmethod
+    def aligned_empty(shape: Tuple[int, ...], dtype) -> np.ndarray:
+        """
+        Reserva una matriz C-contigua cuyo primer elemento está alineado a
+        ALIGNMENT bytes (una línea de caché), para cargas SIMD alineadas.
+
+        Args:
+            shape: Forma de la matriz
+            dtype: Tipo de dato de NumPy
+
+        Returns:
+            Matriz sin inicializar alineada a ALIGNMENT bytes
+        """
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        buffer = np.empty(nbytes + ALIGNMENT, dtype=np.uint8)
+        offset = -buffer.ctypes.data % ALIGNMENT
+        return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+    @staticmethod
+    def _check_operands(matrix_a: Matrix, matrix_b: Matrix):
+        """
+        Valida que las matrices sean 2-D y compatibles para multiplicación.
+
+        Args:
+            matrix_a: Primera matriz (m x n), ndarray o SharedMatrix
+            matrix_b: Segunda matriz (n x p), ndarray o SharedMatrix
+        """
+        if len(matrix_a.shape) != 2 or len(matrix_b.shape) != 2:
+            raise ValueError(
+                f"Se esperaban matrices 2-D: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+        if matrix_a.shape[1] != matrix_b.shape[0]:
+            raise ValueError(
+                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
+            )
+
+    @staticmethod
+    def _prepare_operand(matrix: Matrix, target) -> Matrix:
+        """
+        Copia una matriz a un buffer C-contiguo y alineado del tipo target si
+        no lo es ya, para que BLAS no copie cada chunk internamente.
+
+        Args:
+            matrix: Matriz (ndarray o SharedMatrix)
+            target: Tipo de dato final
+
+        Returns:
+            La misma matriz si ya cumple, o una copia contigua y alineada
+        """
+        if isinstance(matrix, SharedMatrix):
+            # La memoria compartida ya es contigua y alineada a página
+            if matrix.dtype == target:
+                return matrix
+            matrix = matrix.array
+
+        if (matrix.dtype == target and matrix.flags.c_contiguous
+                and matrix.ctypes.data % ALIGNMENT == 0):
+            return matrix
+
+        prepared = ParallelProcessor.aligned_empty(matrix.shape, target)
+        np.copyto(prepared, matrix, casting='unsafe')
+        return prepared
 
     @staticmethod
-    def _multiply_chunk(args: Tuple) -> np.ndarray:
+    def _prepare_operands(
+        matrix_a: Matrix,
+        matrix_b: Matrix,
+        dtype
+    ) -> Tuple[Matrix, Matrix]:
         """
-        Multiplica un chunk (porción) de la matriz A con toda la matriz B.
+        Deja ambas matrices listas para BLAS, una sola vez y antes de repartir
+        el trabajo: las enteras se convierten al tipo flotante indicado
+        (np.matmul sobre enteros no usa BLAS sino un bucle genérico mucho más
+        lento), ambas pasan a un mismo tipo (si no, cada chunk repetiría la
+        conversión de la menor) y quedan C-contiguas y alineadas.
 
         Args:
-            args: Tupla (chunk_a, matrix_b)
+            matrix_a: Primera matriz (ndarray o SharedMatrix)
+            matrix_b: Segunda matriz (ndarray o SharedMatrix)
+            dtype: Tipo flotante destino para matrices enteras; si es None
+                   se mantienen enteras, ampliando a int64 las de menos de
+                   32 bits (int8/int16 desbordarían al acumular el producto)
 
         Returns:
-            Resultado de la multiplicación del chunk
+            Tupla (matrix_a, matrix_b) preparadas
         """
-        chunk_a, matrix_b = args
-        return np.matmul(chunk_a, matrix_b)
+        def target_dtype(matrix: Matrix) -> np.dtype:
+            if matrix.dtype.kind in 'iu':
+                if dtype is not None:
+                    return np.dtype(dtype)
+                if matrix.dtype.itemsize < 4:
+                    return np.dtype(np.int64)
+            return matrix.dtype
+
+        target = np.result_type(target_dtype(matrix_a), target_dtype(matrix_b))
+
+        return (
+            ParallelProcessor._prepare_operand(matrix_a, target),
+            ParallelProcessor._prepare_operand(matrix_b, target),
+        )
+
+    @staticmethod
+    def _chunk_tasks(
+        a_ref,
+        b_ref,
+        out_ref,
+        num_rows: int,
+        num_chunks: int
+    ) -> List[Tuple]:
+        """
+        Construye las tareas (a, b, salida, fila_inicio, fila_fin) de cada
+        chunk horizontal. Solo se calculan los límites de filas (cada worker
+        toma su propia vista), sin crear vistas ni listas con np.array_split.
+
+        Args:
+            a_ref: Primera matriz o descriptor de memoria compartida
+            b_ref: Segunda matriz o descriptor de memoria compartida
+            out_ref: Matriz resultado o descriptor de memoria compartida
+            num_rows: Número de filas de la primera matriz
+            num_chunks: Número de chunks horizontales (uno por worker)
+
+        Returns:
+            Lista de tareas para _multiply_chunk
+        """
+        bounds = np.linspace(0, num_rows, num_chunks + 1, dtype=np.int64).tolist()
+
+        return [
+            (a_ref, b_ref, out_ref, start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+
+    @staticmethod
+    def _shared_tasks(
+        matrix_a: Matrix,
+        matrix_b: Matrix,
+        num_chunks: int
+    ) -> Tuple[SharedMatrix, List[Tuple], List[SharedMatrix]]:
+        """
+        Prepara las tareas para procesos: A, B y el resultado viven en memoria
+        compartida y los workers solo reciben descriptores (nombre, forma, dtype).
+
+        Args:
+            matrix_a: Primera matriz (m x n), ndarray o SharedMatrix
+            matrix_b: Segunda matriz (n x p), ndarray o SharedMatrix
+            num_chunks: Número de chunks horizontales
+
+        Returns:
+            Tupla (matriz resultado compartida, tareas, bloques a liberar)
+        """
+        owned = []
+        shared = []
+        for matrix in (matrix_a, matrix_b):
+            if not isinstance(matrix, SharedMatrix):
+                matrix = SharedMatrix.from_array(matrix)
+                owned.append(matrix)
+            shared.append(matrix)
+        shared_a, shared_b = shared
+
+        out = SharedMatrix(
+            (shared_a.shape[0], shared_b.shape[1]),
+            np.result_type(shared_a.dtype, shared_b.dtype)
+        )
+        # Pre-tocar las páginas del resultado, como en el baseline secuencial
+        out.array.fill(0)
+        owned.append(out)
+
+        tasks = ParallelProcessor._chunk_tasks(
+            shared_a.handle, shared_b.handle, out.handle,
+            shared_a.shape[0], num_chunks
+        )
+        return out, tasks, owned
 
     @staticmethod
     def parallel_multiply_processes(
-        matrix_a: np.ndarray,
-        matrix_b: np.ndarray,
-        num_processes: int
+        matrix_a: Matrix,
+        matrix_b: Matrix,
+        num_processes: int = None,
+        dtype=np.float32
     ) -> Tuple[np.ndarray, float]:
         """
         Multiplicación paralela usando multiprocessing (múltiples procesos).
         Divide matrix_a en chunks horizontales y los procesa en paralelo.
 
         Args:
-            matrix_a: Primera matriz (m x n)
-            matrix_b: Segunda matriz (n x p)
-            num_processes: Número de procesos paralelos
+            matrix_a: Primera matriz (m x n), ndarray o SharedMatrix
+            matrix_b: Segunda matriz (n x p), ndarray o SharedMatrix
+            num_processes: Número de procesos paralelos (None: effective_cpus())
+            dtype: Tipo flotante al que se convierten las matrices enteras
+                   para usar BLAS (None para no convertir). Las entradas
+                   llegan a BLAS C-contiguas y alineadas a 64 bytes.
 
         Returns:
             Tupla (matriz resultado, tiempo de ejecución en segundos)
         """
-        if matrix_a.shape[1] != matrix_b.shape[0]:
-            raise ValueError(
-                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
-            )
+        ParallelProcessor._check_operands(matrix_a, matrix_b)
+
+        if num_processes is None:
+            num_processes = effective_cpus()
+
+        # Entradas flotantes, C-contiguas y alineadas, fuera de la medición
+        matrix_a, matrix_b = ParallelProcessor._prepare_operands(
+            matrix_a, matrix_b, dtype
+        )
+
+        # Pool persistente: su creación no forma parte de la medición
+        pool = ParallelProcessor.get_pool(num_processes)
 
-        start_time = time.perf_counter()
+        # Dividir matrix_a en un bloque de filas por proceso (BLAS ya hace su
+        # propio blocking para caché dentro de cada bloque); cada proceso
+        # escribe sus filas directamente en la matriz resultado compartida.
+        # La memoria compartida se prepara fuera de la medición
+        out, args_list, owned = ParallelProcessor._shared_tasks(
+            matrix_a, matrix_b, num_processes
+        )
 
-        # Dividir matrix_a en chunks horizontales
-        chunks = np.array_split(matrix_a, num_processes, axis=0)
+        try:
+            start_time = time.perf_counter()
 
-        # Crear argumentos para cada proceso
-        args_list = [(chunk, matrix_b) for chunk in chunks]
+            # Ejecutar en paralelo usando Pool: num_processes tareas, así que
+            # solo trabajan num_processes procesos aunque el pool sea mayor
+            pool.map(_multiply_chunk, args_list, chunksize=1)
 
-        # Ejecutar en paralelo usando Pool
-        with Pool(processes=num_processes) as pool:
-            results = pool.map(ParallelProcessor._multiply_chunk, args_list)
+            end_time = time.perf_counter()
 
-        # Concatenar resultados
-        result = np.vstack(results)
+            # Copiar el resultado antes de liberar la memoria compartida
+            result = out.array.copy()
+        finally:
+            for shared in owned:
+                shared.unlink()
 
-        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         return result, execution_time
@@ -88,91 +493,168 @@ class ParallelProcessor:
     def parallel_multiply_threads(
         matrix_a: np.ndarray,
         matrix_b: np.ndarray,
-        num_threads: int
+        num_threads: int = None,
+        dtype=np.float32
     ) -> Tuple[np.ndarray, float]:
         """
         Multiplicación paralela usando threading (múltiples hilos).
-        Nota: En Python, threads no proporcionan verdadero paralelismo
-        debido al GIL (Global Interpreter Lock), pero se incluye para comparación.
+        Es el método recomendado: np.matmul libera el GIL mientras ejecuta
+        BLAS, así que los hilos corren en paralelo real sobre la misma memoria,
+        sin crear procesos ni copiar matrices. Multiprocessing queda como
+        alternativa para kernels en Python puro que sí retienen el GIL.
 
         Args:
             matrix_a: Primera matriz (m x n)
             matrix_b: Segunda matriz (n x p)
-            num_threads: Número de hilos paralelos
+            num_threads: Número de hilos paralelos (None: effective_cpus())
+            dtype: Tipo flotante al que se convierten las matrices enteras
+                   para usar BLAS (None para no convertir). Las entradas
+                   llegan a BLAS C-contiguas y alineadas a 64 bytes.
 
         Returns:
             Tupla (matriz resultado, tiempo de ejecución en segundos)
         """
-        if matrix_a.shape[1] != matrix_b.shape[0]:
-            raise ValueError(
-                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
-            )
+        ParallelProcessor._check_operands(matrix_a, matrix_b)
+
+        if num_threads is None:
+            num_threads = effective_cpus()
+
+        # Entradas flotantes, C-contiguas y alineadas, fuera de la medición
+        matrix_a, matrix_b = ParallelProcessor._prepare_operands(
+            matrix_a, matrix_b, dtype
+        )
+
+        # Pool de hilos persistente: su creación no forma parte de la medición
+        executor = ParallelProcessor.get_thread_pool(num_threads)
+
+        # Dividir matrix_a en un bloque de filas por hilo; cada hilo escribe sus
+        # filas directamente en la matriz resultado, preasignada y pre-tocada
+        # fuera de la medición
+        result = ParallelProcessor.aligned_empty(
+            (matrix_a.shape[0], matrix_b.shape[1]),
+            np.result_type(matrix_a.dtype, matrix_b.dtype)
+        )
+        result.fill(0)
+        args_list = ParallelProcessor._chunk_tasks(
+            matrix_a, matrix_b, result, matrix_a.shape[0], num_threads
+        )
+
+        # Ejecutar en paralelo usando ThreadPoolExecutor, con BLAS a un hilo
+        # por cada hilo de Python (el límite de BLAS es global al proceso);
+        # num_threads tareas, así que solo trabajan num_threads hilos
+        with _BLAS_CONTROLLER.limit(limits=1, user_api='blas'):
+            start_time = time.perf_counter()
+            list(executor.map(_multiply_chunk, args_list))
+            end_time = time.perf_counter()
+        execution_time = end_time - start_time
 
-        start_time = time.perf_counter()
+        return result, execution_time
+
+    @staticmethod
+    def parallel_multiply_executor(
+        matrix_a: Matrix,
+        matrix_b: Matrix,
+        num_workers: int = None,
+        executor: ProcessPoolExecutor = None,
+        dtype=np.float32
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Multiplicación paralela usando ProcessPoolExecutor.
+        Alternativa moderna a multiprocessing.Pool.
+
+        Args:
+            matrix_a: Primera matriz (m x n), ndarray o SharedMatrix
+            matrix_b: Segunda matriz (n x p), ndarray o SharedMatrix
+            num_workers: Número de workers paralelos (None: effective_cpus())
+            executor: Executor con al menos num_workers procesos a reutilizar
+                      (se envían num_workers tareas). Si es None se usa el
+                      executor persistente.
+            dtype: Tipo flotante al que se convierten las matrices enteras
+                   para usar BLAS (None para no convertir). Las entradas
+                   llegan a BLAS C-contiguas y alineadas a 64 bytes.
+
+        Returns:
+            Tupla (matriz resultado, tiempo de ejecución en segundos)
+        """
+        ParallelProcessor._check_operands(matrix_a, matrix_b)
 
-        # Dividir matrix_a en chunks horizontales
-        chunks = np.array_split(matrix_a, num_threads, axis=0)
+        if num_workers is None:
+            num_workers = effective_cpus()
 
-        # Crear argumentos para cada hilo
-        args_list = [(chunk, matrix_b) for chunk in chunks]
+        # Entradas flotantes, C-contiguas y alineadas, fuera de la medición
+        matrix_a, matrix_b = ParallelProcessor._prepare_operands(
+            matrix_a, matrix_b, dtype
+        )
 
-        # Ejecutar en paralelo usando ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=num_threads) as executor:
-            results = list(executor.map(
-                lambda args: ParallelProcessor._multiply_chunk(args),
-                args_list
-            ))
+        # Executor persistente: su creación no forma parte de la medición
+        if executor is None:
+            executor = ParallelProcessor.get_executor(num_workers)
 
-        # Concatenar resultados
-        result = np.vstack(results)
+        # Dividir matrix_a en un bloque de filas por worker; cada proceso
+        # escribe sus filas directamente en la matriz resultado compartida.
+        # La memoria compartida se prepara fuera de la medición
+        out, args_list, owned = ParallelProcessor._shared_tasks(
+            matrix_a, matrix_b, num_workers
+        )
+
+        try:
+            start_time = time.perf_counter()
+
+            # Ejecutar en paralelo usando ProcessPoolExecutor: num_workers
+            # tareas, así que solo trabajan num_workers procesos
+            list(executor.map(_multiply_chunk, args_list))
+
+            end_time = time.perf_counter()
+
+            # Copiar el resultado antes de liberar la memoria compartida
+            result = out.array.copy()
+        finally:
+            for shared in owned:
+                shared.unlink()
 
-        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         return result, execution_time
 
     @staticmethod
-    def parallel_multiply_executor(
+    def parallel_multiply_blas(
         matrix_a: np.ndarray,
         matrix_b: np.ndarray,
-        num_workers: int
+        num_threads: int = None,
+        dtype=np.float32
     ) -> Tuple[np.ndarray, float]:
         """
-        Multiplicación paralela usando ProcessPoolExecutor.
-        Alternativa moderna a multiprocessing.Pool.
+        Multiplicación paralela delegada en BLAS multihilo (OpenBLAS/MKL).
+        Un único np.matmul sin división en chunks: BLAS reparte el trabajo
+        entre num_threads hilos nativos con sus propios micro-kernels y
+        bloqueo de caché.
 
         Args:
             matrix_a: Primera matriz (m x n)
             matrix_b: Segunda matriz (n x p)
-            num_workers: Número de workers paralelos
+            num_threads: Número de hilos de BLAS (None: effective_cpus())
+            dtype: Tipo flotante al que se convierten las matrices enteras
+                   para usar BLAS (None para no convertir). Las entradas
+                   llegan a BLAS C-contiguas y alineadas a 64 bytes.
 
         Returns:
             Tupla (matriz resultado, tiempo de ejecución en segundos)
         """
-        if matrix_a.shape[1] != matrix_b.shape[0]:
-            raise ValueError(
-                f"Dimensiones incompatibles: {matrix_a.shape} y {matrix_b.shape}"
-            )
-
-        start_time = time.perf_counter()
+        ParallelProcessor._check_operands(matrix_a, matrix_b)
 
-        # Dividir matrix_a en chunks horizontales
-        chunks = np.array_split(matrix_a, num_workers, axis=0)
+        if num_threads is None:
+            num_threads = effective_cpus()
 
-        # Crear argumentos para cada worker
-        args_list = [(chunk, matrix_b) for chunk in chunks]
+        # Entradas flotantes, C-contiguas y alineadas, fuera de la medición
+        matrix_a, matrix_b = ParallelProcessor._prepare_operands(
+            matrix_a, matrix_b, dtype
+        )
 
-        # Ejecutar en paralelo usando ProcessPoolExecutor
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            results = list(executor.map(
-                ParallelProcessor._multiply_chunk,
-                args_list
-            ))
+        with _BLAS_CONTROLLER.limit(limits=num_threads, user_api='blas'):
+            start_time = time.perf_counter()
+            result = np.matmul(matrix_a, matrix_b)
+            end_time = time.perf_counter()
 
-        # Concatenar resultados
-        result = np.vstack(results)
-
-        end_time = time.perf_counter()
         execution_time = end_time - start_time
 
         return result, execution_time
@@ -185,6 +667,15 @@ class ParallelProcessor:
     ) -> dict:
         """
         Compara diferentes métodos de paralelización con distintos números de workers.
+        Las matrices se preparan y se copian a memoria compartida una sola vez
+        para todo el barrido. Hay un único pool de cada tipo (procesos,
+        ProcessPoolExecutor e hilos), creado antes de medir con max(workers_list)
+        workers: el punto de N workers se ejecuta sobre ese pool enviando
+        exactamente N bloques de filas (uno por worker), así que como mucho N
+        workers calculan a la vez y el resto espera ocioso.
+        BLAS queda limitado a un hilo durante todo el barrido (los workers ya
+        lo están desde su inicializador); solo el método BLAS multihilo usa
+        num_workers hilos de BLAS.
 
         Args:
             matrix_a: Primera matriz
@@ -200,31 +691,55 @@ class ParallelProcessor:
             'sequential': None,
             'multiprocessing': {},
             'threading': {},
-            'executor': {}
+            'executor': {},
+            'blas': {}
         }
 
-        # Secuencial (baseline)
-        _, seq_time = MatrixOperations.sequential_multiply(matrix_a, matrix_b)
-        results['sequential'] = seq_time
+        with _BLAS_CONTROLLER.limit(limits=1, user_api='blas'):
+            # Secuencial (baseline)
+            _, seq_time = MatrixOperations.sequential_multiply(matrix_a, matrix_b)
+            results['sequential'] = seq_time
 
-        # Probar diferentes números de workers
-        for num_workers in workers_list:
-            # Multiprocessing
-            _, mp_time = ParallelProcessor.parallel_multiply_processes(
-                matrix_a, matrix_b, num_workers
+            # Preparar las matrices una vez para todos los métodos y workers
+            matrix_a, matrix_b = ParallelProcessor._prepare_operands(
+                matrix_a, matrix_b, np.float32
             )
-            results['multiprocessing'][num_workers] = mp_time
 
-            # Threading
-            _, th_time = ParallelProcessor.parallel_multiply_threads(
-                matrix_a, matrix_b, num_workers
-            )
-            results['threading'][num_workers] = th_time
-
-            # Executor
-            _, ex_time = ParallelProcessor.parallel_multiply_executor(
-                matrix_a, matrix_b, num_workers
-            )
-            results['executor'][num_workers] = ex_time
+            # Un pool de cada tipo, del tamaño máximo, para todo el barrido
+            max_workers = max(workers_list)
+            ParallelProcessor.get_pool(max_workers)
+            ParallelProcessor.get_executor(max_workers)
+            ParallelProcessor.get_thread_pool(max_workers)
+
+            with SharedMatrix.from_array(matrix_a) as shared_a, \
+                    SharedMatrix.from_array(matrix_b) as shared_b:
+                # Probar diferentes números de workers
+                for num_workers in workers_list:
+                    # Multiprocessing
+                    _, mp_time = ParallelProcessor.parallel_multiply_processes(
+                        shared_a, shared_b, num_workers
+                    )
+                    results['multiprocessing'][num_workers] = mp_time
+
+                    # Threading
+                    _, th_time = ParallelProcessor.parallel_multiply_threads(
+                        matrix_a, matrix_b, num_workers
+                    )
+                    results['threading'][num_workers] = th_time
+
+                    # Executor
+                    _, ex_time = ParallelProcessor.parallel_multiply_executor(
+                        shared_a, shared_b, num_workers
+                    )
+                    results['executor'][num_workers] = ex_time
+
+                    # BLAS multihilo
+                    _, blas_time = ParallelProcessor.parallel_multiply_blas(
+                        matrix_a, matrix_b, num_workers
+                    )
+                    results['blas'][num_workers] = blas_time
 
         return results
+
+
+atexit.register(ParallelProcessor.shutdown_pools)
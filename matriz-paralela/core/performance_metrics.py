@@ -6,6 +6,13 @@ Implementa cálculos de Ley de Amdahl, speedup y eficiencia.
 import numpy as np
 from typing import Dict, List
 
+# Unidades de format_time: (factor de escala, sufijo, decimales)
+_TIME_UNITS = (
+    (1_000_000, "μs", 2),
+    (1_000, "ms", 2),
+    (1, "s", 4),
+)
+
 
 class PerformanceMetrics:
     """Clase para calcular métricas de rendimiento de paralelización."""
@@ -82,6 +89,8 @@ class PerformanceMetrics:
     ) -> Dict[int, float]:
         """
         Calcula la Ley de Amdahl para un rango de procesadores.
+        Se evalúa de forma vectorizada (una sola operación de NumPy) en lugar
+        de llamar a amdahl_law para cada número de procesadores.
 
         Args:
             parallel_fraction: Fracción paralelizable
@@ -90,14 +99,37 @@ class PerformanceMetrics:
         Returns:
             Diccionario {num_processors: speedup_teorico}
         """
-        results = {}
+        if max_processors < 1:
+            return {}
 
-        for num_proc in range(1, max_processors + 1):
-            results[num_proc] = PerformanceMetrics.amdahl_law(
-                parallel_fraction, num_proc
-            )
+        speedups = PerformanceMetrics.amdahl_grid([parallel_fraction], max_processors)[0]
 
-        return results
+        return dict(zip(range(1, max_processors + 1), speedups.tolist()))
+
+    @staticmethod
+    def amdahl_grid(fractions: np.ndarray, max_processors: int) -> np.ndarray:
+        """
+        Calcula la Ley de Amdahl para varias fracciones y procesadores a la vez.
+
+        Args:
+            fractions: Fracciones paralelizables (0.0 a 1.0)
+            max_processors: Número máximo de procesadores
+
+        Returns:
+            Matriz (len(fractions) x max_processors) donde la fila i, columna j
+            es el speedup teórico de fractions[i] con j + 1 procesadores
+        """
+        fractions = np.asarray(fractions, dtype=np.float64)
+
+        if np.any((fractions < 0) | (fractions > 1)):
+            raise ValueError("parallel_fraction debe estar entre 0 y 1")
+
+        if max_processors <= 0:
+            raise ValueError("num_processors debe ser mayor que 0")
+
+        processors = np.arange(1, max_processors + 1, dtype=np.float64)
+
+        return 1.0 / ((1.0 - fractions[:, None]) + fractions[:, None] / processors)
 
     @staticmethod
     def analyze_results(
@@ -127,13 +159,21 @@ class PerformanceMetrics:
             'amdahl_predictions': {}
         }
 
-        # Calcular speedup y eficiencia para cada número de workers
-        for num_workers, p_time in parallel_times.items():
-            speedup = PerformanceMetrics.calculate_speedup(sequential_time, p_time)
-            efficiency = PerformanceMetrics.calculate_efficiency(speedup, num_workers)
+        # Calcular speedup y eficiencia para todos los workers a la vez
+        # (0 cuando el tiempo o los workers son 0, como calculate_speedup/efficiency)
+        workers = np.fromiter(parallel_times.keys(), dtype=np.int64, count=len(parallel_times))
+        times = np.fromiter(parallel_times.values(), dtype=np.float64, count=len(parallel_times))
 
-            analysis['speedups'][num_workers] = speedup
-            analysis['efficiencies'][num_workers] = efficiency
+        speedups = np.divide(
+            sequential_time, times, out=np.zeros_like(times), where=times != 0
+        )
+        efficiencies = np.divide(
+            speedups, workers, out=np.zeros_like(speedups), where=workers != 0
+        )
+
+        worker_keys = workers.tolist()
+        analysis['speedups'] = dict(zip(worker_keys, speedups.tolist()))
+        analysis['efficiencies'] = dict(zip(worker_keys, efficiencies.tolist()))
 
         # Calcular predicciones de Amdahl para diferentes fracciones paralelas
         max_workers = max(parallel_times.keys())
@@ -150,24 +190,26 @@ class PerformanceMetrics:
         efficiency_threshold: float = 0.7
     ) -> int:
         """
-        Determina el número óptimo de workers basado en eficiencia.
+        Determina el número óptimo de workers basado en eficiencia:
+        el mayor número de workers cuya eficiencia alcanza el umbral.
 
         Args:
             speedups: Diccionario {num_workers: speedup}
             efficiency_threshold: Umbral mínimo de eficiencia aceptable
 
         Returns:
-            Número óptimo de workers
+            Número óptimo de workers (1 si ninguno alcanza el umbral)
         """
-        optimal = 1
-
-        for num_workers, speedup in speedups.items():
-            efficiency = PerformanceMetrics.calculate_efficiency(speedup, num_workers)
+        workers = np.fromiter(speedups.keys(), dtype=np.int64, count=len(speedups))
+        values = np.fromiter(speedups.values(), dtype=np.float64, count=len(speedups))
 
-            if efficiency >= efficiency_threshold:
-                optimal = num_workers
+        # Eficiencia 0 para 0 workers, igual que calculate_efficiency
+        efficiencies = np.divide(
+            values, workers, out=np.zeros_like(values), where=workers != 0
+        )
+        mask = efficiencies >= efficiency_threshold
 
-        return optimal
+        return int(workers[mask].max()) if mask.any() else 1
 
     @staticmethod
     def calculate_max_theoretical_speedup(parallel_fraction: float) -> float:
@@ -232,9 +274,6 @@ class PerformanceMetrics:
         Returns:
             String formateado
         """
-        if seconds < 0.001:
-            return f"{seconds * 1_000_000:.2f} μs"
-        elif seconds < 1:
-            return f"{seconds * 1_000:.2f} ms"
-        else:
-            return f"{seconds:.4f} s"
+        # Índice en la tabla de unidades: 0 (< 1 ms), 1 (< 1 s) o 2
+        scale, suffix, decimals = _TIME_UNITS[(seconds >= 0.001) + (seconds >= 1)]
+        return f"{seconds * scale:.{decimals}f} {suffix}"
@@ -0,0 +1,84 @@
+"""
+Módulo de matrices en memoria compartida.
+Permite que varios procesos lean la misma matriz sin copiarla (pickle).
+"""
+
+import numpy as np
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple
+
+
+class SharedMatrix:
+    """Matriz NumPy respaldada por un bloque de memoria compartida."""
+
+    def __init__(self, shape: Tuple[int, ...], dtype, name: str = None):
+        """
+        Crea un bloque nuevo o se adjunta a uno existente.
+
+        Args:
+            shape: Forma de la matriz
+            dtype: Tipo de dato de NumPy
+            name: Nombre del bloque existente; si es None se crea uno nuevo
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = name is None
+
+        if self.owner:
+            nbytes = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+            self.shm = SharedMemory(create=True, size=nbytes)
+        else:
+            self.shm = SharedMemory(name=name)
+
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'SharedMatrix':
+        """
+        Copia una matriz existente a un bloque de memoria compartida nuevo.
+
+        Args:
+            array: Matriz NumPy a copiar
+
+        Returns:
+            SharedMatrix con el contenido de la matriz
+        """
+        shared = cls(array.shape, array.dtype)
+        np.copyto(shared.array, array)
+        return shared
+
+    @classmethod
+    def attach(cls, handle: Tuple[str, Tuple[int, ...], str]) -> 'SharedMatrix':
+        """
+        Se adjunta a un bloque creado por otro proceso.
+
+        Args:
+            handle: Tupla (nombre, forma, dtype) obtenida de `handle`
+
+        Returns:
+            SharedMatrix sin propiedad del bloque
+        """
+        name, shape, dtype = handle
+        return cls(shape, dtype, name=name)
+
+    @property
+    def handle(self) -> Tuple[str, Tuple[int, ...], str]:
+        """Descriptor serializable (nombre, forma, dtype) para otros procesos."""
+        return self.shm.name, self.shape, self.dtype.str
+
+    def close(self):
+        """Libera la vista local del bloque."""
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        """Cierra y destruye el bloque (solo el proceso creador)."""
+        self.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> 'SharedMatrix':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unlink()
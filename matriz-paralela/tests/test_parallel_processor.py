@@ -0,0 +1,38 @@
+"""
+Pruebas de ParallelProcessor.
+"""
+
+import unittest
+
+import numpy as np
+
+from core.matrix_operations import MatrixOperations
+from core.parallel_processor import ParallelProcessor
+
+
+class TestIntegerOperands(unittest.TestCase):
+    """Operandos enteros estrechos sin conversión a flotante (dtype=None)."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.matrix_a = MatrixOperations.generate_random_matrix(64, 48, rng)
+        self.matrix_b = MatrixOperations.generate_random_matrix(48, 32, rng)
+        self.expected = self.matrix_a.astype(np.int64) @ self.matrix_b.astype(np.int64)
+
+    def test_int8_threads_no_overflow(self):
+        result, _ = ParallelProcessor.parallel_multiply_threads(
+            self.matrix_a, self.matrix_b, 2, dtype=None
+        )
+        self.assertEqual(result.dtype, np.int64)
+        np.testing.assert_array_equal(result, self.expected)
+
+    def test_int8_processes_no_overflow(self):
+        result, _ = ParallelProcessor.parallel_multiply_processes(
+            self.matrix_a, self.matrix_b, 2, dtype=None
+        )
+        self.assertEqual(result.dtype, np.int64)
+        np.testing.assert_array_equal(result, self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
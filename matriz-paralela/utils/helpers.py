@@ -2,18 +2,37 @@
 Módulo de funciones auxiliares para la aplicación.
 """
 
+import os
 import platform
 import psutil
 import numpy as np
+from functools import lru_cache
 from typing import Dict
 
 
-def get_system_info() -> Dict:
+def effective_cpus() -> int:
     """
-    Obtiene información detallada del sistema.
+    Número de CPUs que este proceso puede usar realmente. A diferencia de
+    os.cpu_count(), respeta la afinidad impuesta por taskset, cgroups o
+    contenedores (Linux); en otros sistemas recurre a os.cpu_count().
 
     Returns:
-        Diccionario con información del sistema
+        Número de CPUs utilizables (al menos 1)
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict:
+    """
+    Obtiene la información del sistema que no cambia durante la ejecución
+    (plataforma y número de núcleos); se consulta una sola vez.
+
+    Returns:
+        Diccionario con información estática del sistema
     """
     return {
         'platform': platform.system(),
@@ -23,14 +42,65 @@ def get_system_info() -> Dict:
         'processor': platform.processor(),
         'cpu_count_physical': psutil.cpu_count(logical=False),
         'cpu_count_logical': psutil.cpu_count(logical=True),
-        'cpu_freq_current': f"{psutil.cpu_freq().current:.2f} MHz" if psutil.cpu_freq() else "N/A",
-        'cpu_freq_max': f"{psutil.cpu_freq().max:.2f} MHz" if psutil.cpu_freq() else "N/A",
-        'ram_total': f"{psutil.virtual_memory().total / (1024**3):.2f} GB",
-        'ram_available': f"{psutil.virtual_memory().available / (1024**3):.2f} GB",
-        'ram_percent': f"{psutil.virtual_memory().percent}%"
     }
 
 
+def get_system_info_raw() -> Dict:
+    """
+    Obtiene información del sistema como valores numéricos, sin formatear.
+    Solo la frecuencia y la memoria se consultan en cada llamada.
+
+    Returns:
+        Diccionario con información del sistema (frecuencias en MHz o None,
+        memoria en bytes, porcentaje de RAM usada)
+    """
+    # Una sola consulta a psutil por objeto
+    freq = psutil.cpu_freq()
+    memory = psutil.virtual_memory()
+
+    return {
+        **_static_system_info(),
+        'cpu_freq_current': freq.current if freq else None,
+        'cpu_freq_max': freq.max if freq else None,
+        'ram_total': memory.total,
+        'ram_available': memory.available,
+        'ram_percent': memory.percent
+    }
+
+
+def format_system_info(raw_info: Dict) -> Dict:
+    """
+    Convierte la información de get_system_info_raw a texto para la interfaz.
+
+    Args:
+        raw_info: Diccionario devuelto por get_system_info_raw
+
+    Returns:
+        Diccionario con los mismos campos formateados
+    """
+    freq_current = raw_info['cpu_freq_current']
+    freq_max = raw_info['cpu_freq_max']
+
+    return {
+        **raw_info,
+        'cpu_freq_current': f"{freq_current:.2f} MHz" if freq_current is not None else "N/A",
+        'cpu_freq_max': f"{freq_max:.2f} MHz" if freq_max is not None else "N/A",
+        'ram_total': f"{raw_info['ram_total'] / (1024**3):.2f} GB",
+        'ram_available': f"{raw_info['ram_available'] / (1024**3):.2f} GB",
+        'ram_percent': f"{raw_info['ram_percent']}%"
+    }
+
+
+def get_system_info() -> Dict:
+    """
+    Obtiene información detallada del sistema.
+
+    Returns:
+        Diccionario con información del sistema
+    """
+    return format_system_info(get_system_info_raw())
+
+
 def format_matrix_size(size: int) -> str:
     """
     Formatea el tamaño de matriz a string legible.
@@ -44,9 +114,11 @@ def format_matrix_size(size: int) -> str:
     return f"{size} x {size}"
 
 
-def estimate_memory_usage(matrix_size: int, dtype=np.int32) -> str:
+def estimate_memory_usage(matrix_size: int, dtype=np.float32) -> str:
     """
     Estima el uso de memoria para dos matrices cuadradas.
+    Por defecto float32: las matrices enteras se convierten a flotante antes
+    de multiplicar, ya que np.matmul sobre enteros no usa BLAS.
 
     Args:
         matrix_size: Tamaño de cada dimensión de la matriz
@@ -85,12 +157,13 @@ def validate_matrix_size(size: int, max_size: int = 2000) -> bool:
 
 def get_recommended_workers() -> list:
     """
-    Obtiene lista recomendada de números de workers basada en el sistema.
+    Obtiene lista recomendada de números de workers basada en el sistema,
+    limitada a las CPUs que el proceso puede usar (afinidad/cgroups).
 
     Returns:
         Lista de números de workers recomendados
     """
-    logical_cpus = psutil.cpu_count(logical=True)
+    logical_cpus = min(psutil.cpu_count(logical=True), effective_cpus())
 
     if logical_cpus <= 2:
         return [1, 2]